@@ -24,8 +24,14 @@
 """
 
 from runner import Runner
+from trajectory import Trajectory
+from replay import checkpoint_file_name, write_checkpoints
+from array import array
 from typing import Optional
+from collections import deque
 import csv
+import heapq
+import os
 import matplotlib.pyplot as plt
 
 
@@ -40,12 +46,17 @@ class Cell:
         return f"({self.north}, {self.east}, {self.south}, {self.west})"
 
 class Maze:
+    # used by plan_route, orientations are in clockwise order
+    _ORIENTATIONS: str = "NESW"
+    _DX: tuple[int, int, int, int] = (0, 1, 0, -1)
+    _DY: tuple[int, int, int, int] = (1, 0, -1, 0)
+    _ROUTE_ACTIONS: tuple[str, str, str, str] = ("F", "L", "R", "LL")
 
     def __init__(self, width:int = 5, height:int = 5):
         self._width = width
         self._height = height
         self._maze: list[list[Cell]] = self._initialize_maze(width, height)
-        self._explored_coordinates: list[tuple[int, int]] = []
+        self._trajectory: Trajectory = Trajectory(width, height)
         self._exploration_steps = 0
 
     @staticmethod
@@ -76,8 +87,13 @@ class Maze:
         return self._height
 
     @property
-    def explored_coordinates(self):
-        return self._explored_coordinates
+    def trajectory(self) -> Trajectory:
+        return self._trajectory
+
+    @property
+    def explored_coordinates(self) -> list[tuple[int, int]]:
+        # built on request, the trajectory itself is stored compactly
+        return self._trajectory.coordinates()
 
     def add_horizontal_wall(self, x_coordinate, horizontal_line) -> None:
         # when we add wall, it causes 2 cells to change, therefore update both of them
@@ -165,12 +181,26 @@ class Maze:
         myRunner = self.go_straight(myRunner)
         return (myRunner, sequence)
 
-    def explore(self, myRunner: Runner, goal: Optional["tuple[int, int]"]=None, explore_file: Optional[str]="exploration.csv") -> str:
+    def explore(self, myRunner: Runner, goal: Optional["tuple[int, int]"]=None, explore_file: Optional[str]="exploration.csv", checkpoint_interval: Optional[int]=None) -> str:
         # sequence represents the actions the runner took, for instance Left(L) or Right(R) till the runner
-        # reaches the goal
-        sequence: str = ""
+        # reaches the goal. It is stored as opcodes in self._trajectory, the string is built only here.
+        self._explore(myRunner, goal, explore_file, checkpoint_interval)
+        return self._trajectory.actions()
+
+    def _explore(self, myRunner: Runner, goal: Optional["tuple[int, int]"], explore_file: str, checkpoint_interval: Optional[int]) -> None:
+        '''explores the maze and records the steps to self._trajectory'''
+        # if checkpoint_interval is given, state of the runner is stored every checkpoint_interval steps
+        # next to the explore_file, so the exploration can be replayed from any step (see replay.py)
         if goal == None:
             goal = (self._width - 1, self._height - 1)
+        if checkpoint_interval != None and checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval must be at least 1")
+        checkpoints: list[tuple[int, int, int, str, int]] = []
+
+        # checkpoints of the previous exploration don't match the new exploration file
+        checkpoint_file: str = checkpoint_file_name(explore_file)
+        if os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
 
 
         with open(explore_file, 'w', newline='') as exp_f:
@@ -178,10 +208,14 @@ class Maze:
             exp_writer = csv.DictWriter(exp_f, fieldnames=headers)
 
             exp_writer.writeheader()
-            self._explored_coordinates.append((myRunner.x, myRunner.y))
+            self._trajectory.start(myRunner.x, myRunner.y)
 
             self._exploration_steps = 0
             while (myRunner.get_position() != goal):
+                if checkpoint_interval != None and self._exploration_steps % checkpoint_interval == 0:
+                    # offset of the row of the next step
+                    checkpoints.append((self._exploration_steps, myRunner.x, myRunner.y, myRunner.orientation, exp_f.tell()))
+
                 prev_x: int = myRunner.x
                 prev_y: int = myRunner.y
                 (myRunner, move_seq) = self.move(myRunner)
@@ -189,11 +223,14 @@ class Maze:
                 # write to the file
                 exp_writer.writerow({"Step": self._exploration_steps + 1, "x-coordinate": prev_x, "y-coordinate": prev_y, "Actions": move_seq})
 
-                self._explored_coordinates.append((myRunner.x, myRunner.y))
-                sequence += move_seq
+                self._trajectory.record(move_seq, myRunner.x, myRunner.y)
                 self._exploration_steps += 1
 
-        return sequence
+            if checkpoint_interval != None and self._exploration_steps % checkpoint_interval == 0:
+                checkpoints.append((self._exploration_steps, myRunner.x, myRunner.y, myRunner.orientation, exp_f.tell()))
+
+        if checkpoint_interval != None:
+            write_checkpoints(checkpoint_file, checkpoints)
 
 
     @staticmethod
@@ -338,7 +375,7 @@ class Maze:
 
             st_f.writelines(str(len(shortest_path)) + "\n")
 
-    def shortest_path(self, starting: Optional[tuple[int, int]] = None, goal: Optional[tuple[int, int]] = None, exploration_file: Optional[str]="exploration.csv", stat_file: Optional[str]="statistics.txt") -> list[tuple[int, int]]:
+    def shortest_path(self, starting: Optional[tuple[int, int]] = None, goal: Optional[tuple[int, int]] = None, exploration_file: Optional[str]="exploration.csv", stat_file: Optional[str]="statistics.txt", checkpoint_interval: Optional[int]=None) -> list[tuple[int, int]]:
         ''' Return the shortest path from start to the goal. (Not the actual shortest path)
             Firstly, runner explores the maze and stores the coordinates that it stumbled
             Then we run our algorithm.
@@ -346,6 +383,9 @@ class Maze:
             to the visited coordinate that means we have already been in that coordinate. And of course previous
             path to that coordinate was in shorter distance than the current one, so delete the coordinates from
             shorter_path after first instance of that coordinate.
+
+            The algorithm works on cell indices of the trajectory. position[cell] keeps the index of the cell
+            in shortest_path (-1 if it is not there), so we don't have to search shortest_path every time.
         '''
 
         if starting == None:
@@ -353,22 +393,25 @@ class Maze:
         else:
             myRunner = Runner(starting[0], starting[1])
 
-        seq = self.explore(myRunner, goal, exploration_file)
+        self._explore(myRunner, goal, exploration_file, checkpoint_interval)
+
+        visited: bytearray = bytearray(self._width * self._height)
+        position: array = array('i', [-1]) * (self._width * self._height)
+        path_cells: array = array('I')
 
-        visited: list[tuple[int, int]] = []
-        shortest_path: list[tuple[int, int]] = []
+        for cell in self._trajectory.cells:
+            if not visited[cell]:
+                visited[cell] = 1
+                position[cell] = len(path_cells)
+                path_cells.append(cell)
+            elif position[cell] != -1:
+                # delete the elements after the first instance of the cell
+                i: int = position[cell] + 1
+                for deleted in path_cells[i:]:
+                    position[deleted] = -1
+                del path_cells[i:]
 
-        for coordinate in self._explored_coordinates:
-            if coordinate not in visited:
-                visited.append(coordinate)
-                shortest_path.append(coordinate)
-            else:
-                for i in range(len(shortest_path)):
-                    if shortest_path[i] == coordinate:
-                        # delete the elements after i
-                        i += 1
-                        del shortest_path[i:]
-                        break
+        shortest_path: list[tuple[int, int]] = [self._trajectory.cell_coordinates(cell) for cell in path_cells]
 
         # write to the statistics file
         score: float = float(self._exploration_steps / 4 + len(shortest_path))
@@ -376,6 +419,133 @@ class Maze:
 
         return shortest_path
 
+    def plan_route(self, starting: Optional[tuple[int, int]] = None, goal: Optional[tuple[int, int]] = None,
+                   orientation: str = "N", forward_cost: float = 1, left_cost: float = 1, right_cost: float = 1,
+                   u_turn_cost: float = 2) -> tuple[list[tuple[int, int]], str]:
+        ''' Return the cheapest route from start to the goal and the actions to follow it.
+            Unlike shortest_path, turns are not free. The search runs over the states (x, y, orientation),
+            from each state the runner can go forward(F), turn left(L), turn right(R) or make a U-turn(LL),
+            each with its own cost. Actions have the same format as the ones explore returns.
+
+            State index is cell * 4 + orientation, where cell = x * height + y(same as in the trajectory) and
+            orientation is the index in "NESW", so distances and parents are kept in flat arrays.
+            A U-turn which costs at least as much as two left or two right turns is never needed, so it is dropped.
+            If the remaining costs are 0 or 1, 0-1 BFS is used. If they are small integers, Dial's algorithm
+            (a queue of buckets, one bucket for each distance) is used. Both are linear in the number of states.
+            Only non-integer costs need Dijkstra with a binary heap.
+        '''
+        if any(cost < 0 for cost in (forward_cost, left_cost, right_cost, u_turn_cost)):
+            raise ValueError("Costs must be non-negative")
+        if orientation not in self._ORIENTATIONS:
+            raise ValueError(f"Incorrect orientation: {orientation}")
+
+        if starting == None:
+            starting = (0, 0)
+        if goal == None:
+            goal = (self._width - 1, self._height - 1)
+        for coordinate in (starting, goal):
+            if coordinate[0] < 0 or coordinate[0] > self._width - 1 \
+            or coordinate[1] < 0 or coordinate[1] > self._height - 1:
+                raise ValueError(f"{coordinate} is out of dimension")
+
+        use_u_turn: bool = u_turn_cost < 2 * min(left_cost, right_cost)
+        costs: list[float] = [forward_cost, left_cost, right_cost]
+        if use_u_turn:
+            costs.append(u_turn_cost)
+
+        height: int = self._height
+        n_states: int = self._width * height * 4
+        start_state: int = (starting[0] * height + starting[1]) * 4 + self._ORIENTATIONS.index(orientation)
+        goal_cell: int = goal[0] * height + goal[1]
+
+        infinity: float = float("inf")
+        distance: list[float] = [infinity] * n_states
+        parent: array = array('i', [-1]) * n_states
+        parent_action: bytearray = bytearray(n_states)  # index of the action in self._ROUTE_ACTIONS
+        distance[start_state] = 0
+
+        def neighbours(state: int):
+            # yields (next state, action, cost)
+            cell, o = divmod(state, 4)
+            x, y = divmod(cell, height)
+            if not self.get_walls(x, y)[o]:    # walls are in the order N, E, S, W as well
+                next_cell: int = (x + self._DX[o]) * height + y + self._DY[o]
+                yield (next_cell * 4 + o, 0, forward_cost)
+            yield (cell * 4 + (o + 3) % 4, 1, left_cost)
+            yield (cell * 4 + (o + 1) % 4, 2, right_cost)
+            if use_u_turn:
+                yield (cell * 4 + (o + 2) % 4, 3, u_turn_cost)
+
+        if all(cost in (0, 1) for cost in costs):
+            # 0-1 BFS: 0 cost edges go to the front of the queue, 1 cost edges to the back
+            queue: deque = deque([start_state])
+            while queue:
+                state = queue.popleft()
+                for (next_state, action, cost) in neighbours(state):
+                    if distance[state] + cost < distance[next_state]:
+                        distance[next_state] = distance[state] + cost
+                        parent[next_state] = state
+                        parent_action[next_state] = action
+                        if cost == 0:
+                            queue.appendleft(next_state)
+                        else:
+                            queue.append(next_state)
+        elif all(float(cost).is_integer() for cost in costs):
+            # Dial's algorithm: distances of the states in the queue are between dist and dist + max_cost,
+            # so max_cost + 1 buckets are enough if we use them in a circle
+            max_cost: int = int(max(costs))
+            buckets: list[list[int]] = [[] for _ in range(max_cost + 1)]
+            buckets[0].append(start_state)
+            queued: int = 1
+            dist: int = 0
+            while queued > 0:
+                bucket: list[int] = buckets[dist % (max_cost + 1)]
+                while bucket:   # 0 cost edges add states to the bucket we are emptying
+                    state = bucket.pop()
+                    queued -= 1
+                    if distance[state] != dist:
+                        continue    # outdated entry
+                    for (next_state, action, cost) in neighbours(state):
+                        if dist + cost < distance[next_state]:
+                            distance[next_state] = dist + int(cost)
+                            parent[next_state] = state
+                            parent_action[next_state] = action
+                            buckets[(dist + int(cost)) % (max_cost + 1)].append(next_state)
+                            queued += 1
+                dist += 1
+        else:
+            heap: list[tuple[float, int]] = [(0, start_state)]
+            while heap:
+                (dist, state) = heapq.heappop(heap)
+                if dist > distance[state]:
+                    continue    # outdated entry
+                for (next_state, action, cost) in neighbours(state):
+                    if dist + cost < distance[next_state]:
+                        distance[next_state] = dist + cost
+                        parent[next_state] = state
+                        parent_action[next_state] = action
+                        heapq.heappush(heap, (dist + cost, next_state))
+
+        # runner can reach the goal in any orientation
+        goal_state: int = min(range(goal_cell * 4, goal_cell * 4 + 4), key=lambda state: distance[state])
+        if distance[goal_state] == infinity:
+            raise ValueError(f"{goal} is not reachable from {starting}")
+
+        # walk back from the goal to the start
+        path: list[tuple[int, int]] = []
+        actions: list[str] = []
+        state = goal_state
+        while state != start_state:
+            if parent_action[state] == 0:
+                path.append(divmod(state // 4, height))
+            actions.append(self._ROUTE_ACTIONS[parent_action[state]])
+            state = parent[state]
+        path.append(tuple(starting))
+
+        path.reverse()
+        actions.reverse()
+        return (path, "".join(actions))
+
     def plot(self, ax):
         for y in range(len(self._maze[0])):
             for x in range(len(self._maze)):
@@ -8,7 +8,7 @@
 
 from maze import Maze
 import argparse
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 import re
 import matplotlib.pyplot as plt
 import time
@@ -24,89 +24,143 @@ def get_file_content(file: str) -> list[str]:
     return content
 
 
+# returns the number of lines and the length of the first line without keeping the content,
+# raises Exception if something goes wrong when reading file
+def get_file_dimensions(file: str) -> tuple[int, int]:
+    rows: int = 0
+    col_sz: int = 0
+    with open(file, 'r') as f:
+        for line in f:
+            if rows == 0:
+                col_sz = len(line.strip())
+            rows += 1
+    return (rows, col_sz)
+
+
+# yields the stripped lines of the opened file one by one, raises IOError if something goes wrong when reading
+def read_lines(f) -> Iterator[str]:
+    try:
+        for line in f:
+            yield line.strip()
+    except Exception:
+        raise IOError("Something happened when reading the file")
+
+
 # checks if dimensions, symbols etc. are correct, raises ValueError if not
-def check_content(content: list[str]) -> None:
+# content is read only once and row by row, so it can be a list or lines streamed from the file.
+# returns the number of rows and columns
+def check_content(content: Iterable[str]) -> tuple[int, int]:
+    wall: str = "#"
+    rows: int = 0
+    col_sz: int = 0
+    # errors are reported in the order of importance: number of rows, size of columns, external walls
+    size_error: Optional[str] = None
+    wall_error: bool = False
+    last_row_is_wall: bool = False
+
+    for row in content:
+        if rows == 0:
+            col_sz = len(row)
+
+        # size of columns must be bigger than or equal to 3 and their lengths must be equal
+        if size_error == None:
+            if len(row) < 3:
+                size_error = "Size of column must be at least 3"
+            elif len(row) != col_sz:
+                size_error = "Size of all columns must be equal"
+
+        # check if external walls are all '#'. Whether the row is the last one is known only at the end
+        if size_error == None:
+            last_row_is_wall = row.count(wall) == len(row)
+            if (rows == 0 and not last_row_is_wall) or row[0] != wall or row[-1] != wall:
+                wall_error = True
+        rows += 1
+
     # 1 cell in actual maze is represented by 3 x 3 array in maze file
     # that's why minimal size for columns and rows is 3
-    if len(content) < 3:
+    if rows < 3:
         raise ValueError("Size of rows must be at least 3")
+    if size_error != None:
+        raise ValueError(size_error)
+    if wall_error or not last_row_is_wall:
+        raise ValueError("Incorrect character in external wall")
 
-    # size of columns must be bigger than or equal to 3 and their lengths must be equal
-    col_sz: int = len(content[0])
-    for row in content:
-        if len(row) < 3:
-            raise ValueError("Size of column must be at least 3")
-        if len(row) != col_sz:
-            raise ValueError("Size of all columns must be equal")
-
-    wall: str = "#"
-    # check if external walls are all '#'
-    for i in range(len(content)):
-        for j in range(len(content[0])):
-            if i == 0 or i + 1 == len(content):
-                if (content[i][j] != wall):
-                    raise ValueError("Incorrect character in external wall")
-            if j == 0 or j + 1 == len(content[0]):
-                if (content[i][j] != wall):
-                    raise ValueError("Incorrect character in external wall")
+    return (rows, col_sz)
 
 
 def maze_reader(maze_file: str, stat_file: Optional[str]="statistics.txt") -> Maze:
+    '''
+        File is never loaded as a whole. First pass checks the content and finds the dimensions of the maze,
+        second pass reads the walls keeping only 3 lines of the file at a time: line of the cells and lines
+        of the walls above and below them.
+    '''
     wall: str = "#"
     path: str = "."
 
     try:
-        content: list[str] = get_file_content(maze_file)
+        f = open(maze_file, 'r')
     except Exception:
         raise IOError("Something happened when reading the file")
 
-    # write the name of the file to the statistics file
-    with open(stat_file, 'w', newline='') as st_f:
-        st_f.writelines(maze_file + "\n")
+    with f:
+        # write the name of the file to the statistics file
+        with open(stat_file, 'w', newline='') as st_f:
+            st_f.writelines(maze_file + "\n")
 
-    try:
         # checks content, raises Exception if anything illegal happens
-        check_content(content)
+        (n_rows, n_cols) = check_content(read_lines(f))
 
-        height: int = len(content) // 2  # height of the actual maze grid
-        width: int = len(content[0]) // 2   # width of the actual maze grid
+        height: int = n_rows // 2  # height of the actual maze grid
+        width: int = n_cols // 2   # width of the actual maze grid
         maze: Maze = Maze(width, height)
 
         # read maze_file
-        for i in range(len(content) - 2, 0, -2):
-            for j in range(1, len(content[0]) - 1, 2):
-                # check if there is an illegal symbol
-                if content[i][j] != wall and content[i][j] != path \
-                    or content[i - 1][j] != wall and content[i - 1][j] != path \
-                    or content[i][j + 1] != wall and content[i][j + 1] != path \
-                    or content[i + 1][j] != wall and content[i + 1][j] != path \
-                    or content[i][j - 1] != wall and content[i][j - 1] != path:
-                    raise ValueError("Incorrect character\n")
-
-
-                # map the coordinates of maze in file to the coordinates of maze to be stored
-                x: int = (j - 1) // 2
-                y: int = (len(content) - (i + 2)) // 2
-
-                # proceed adding the walls
-                if content[i - 1][j] == wall:
-                    maze.add_horizontal_wall(x, y + 1)
-                if content[i][j + 1] == wall:
-                    maze.add_vertical_wall(y, x + 1)
-                if content[i + 1][j] == wall:
-                    maze.add_horizontal_wall(x, y)
-                if content[i][j - 1] == wall:
-                    maze.add_vertical_wall(y, x)
-
-        return maze
-
-    except Exception as e:
-        raise e
+        f.seek(0)
+        above: str = ""
+        current: str = ""
+        for (k, below) in enumerate(read_lines(f)):
+            # line i is the line of the cells if there is an even number of lines after it (counting itself)
+            # which means the bottom row of cells is always on the line n_rows - 2
+            i: int = k - 1
+            if 1 <= i <= n_rows - 2 and (n_rows - i) % 2 == 0:
+                # map the row of maze in file to the row of maze to be stored
+                y: int = (n_rows - (i + 2)) // 2
+
+                for j in range(1, n_cols - 1, 2):
+                    # check if there is an illegal symbol
+                    if current[j] != wall and current[j] != path \
+                        or above[j] != wall and above[j] != path \
+                        or current[j + 1] != wall and current[j + 1] != path \
+                        or below[j] != wall and below[j] != path \
+                        or current[j - 1] != wall and current[j - 1] != path:
+                        raise ValueError("Incorrect character\n")
+
+                    # map the column of maze in file to the column of maze to be stored
+                    x: int = (j - 1) // 2
+
+                    # proceed adding the walls
+                    if above[j] == wall:
+                        maze.add_horizontal_wall(x, y + 1)
+                    if current[j + 1] == wall:
+                        maze.add_vertical_wall(y, x + 1)
+                    if below[j] == wall:
+                        maze.add_horizontal_wall(x, y)
+                    if current[j - 1] == wall:
+                        maze.add_vertical_wall(y, x)
+
+            # slide the window by one line
+            above = current
+            current = below
+
+    return maze
 
 def is_in_dimension(content: list[str], starting: Optional[tuple[int, int]], goal: Optional[tuple[int , int]]) -> bool:
     height: int = len(content) // 2  # height of the maze
     width: int = len(content[0]) // 2   # width of the maze
+    return is_in_maze(width, height, starting, goal)
+
 
+def is_in_maze(width: int, height: int, starting: Optional[tuple[int, int]], goal: Optional[tuple[int , int]]) -> bool:
     if goal != None:
         # check if out of dimension
         if goal[0] < 0 or goal[0] > width - 1\
@@ -161,12 +215,12 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     try:
-        content = get_file_content(args.maze)
+        (n_rows, n_cols) = get_file_dimensions(args.maze)
 
         starting: tuple[int, int] = str_to_tuple(args.starting)
         goal: tuple[int, int] = str_to_tuple(args.goal)
 
-        if not is_in_dimension(content, starting, goal):
+        if not is_in_maze(n_cols // 2, n_rows // 2, starting, goal):
             raise ValueError(f"{starting} or {goal} is/are out of dimension\n")
 
         # create maze and run shortest_path algorithm
@@ -189,7 +243,7 @@ if __name__ == "__main__":
 
         myMaze.plot(ax)
         plt.pause(0.2)
-        for pair in myMaze.explored_coordinates:
+        for pair in myMaze.trajectory.iter_coordinates():
             runner = Runner(pair[0], pair[1])
             runner.plot(ax, "green")
             plt.pause(0.2)
@@ -0,0 +1,192 @@
+"""
+    This module implements the Replay class which lets us jump to any step of an exploration without
+    running explore again or reading exploration.csv from the beginning.
+
+    While exploring, Maze.explore can store the state of the runner every N steps to the checkpoint file
+    which is kept next to the exploration file (exploration.csv -> exploration_checkpoints.csv).
+    Each checkpoint has the step, position and orientation of the runner and the offset of the row of the next
+    step in the exploration file.
+
+    Step k means the state of the runner after k steps, so step 0 is the starting position.
+    To get to step k, we take the closest checkpoint before it, seek to its offset in exploration file
+    and apply at most N - 1 steps.
+
+    Author: Rasul Abbaszada
+"""
+
+from runner import Runner
+from array import array
+from bisect import bisect_right
+from typing import Iterator, Optional, TYPE_CHECKING
+import csv
+import os
+import matplotlib.pyplot as plt
+
+if TYPE_CHECKING:
+    from maze import Maze
+
+CHECKPOINT_HEADERS: list[str] = ["Step", "x-coordinate", "y-coordinate", "Orientation", "Offset"]
+
+
+def checkpoint_file_name(exploration_file: str) -> str:
+    '''exploration.csv -> exploration_checkpoints.csv'''
+    (name, extension) = os.path.splitext(exploration_file)
+    return name + "_checkpoints" + extension
+
+
+def write_checkpoints(checkpoint_file: str, checkpoints: list[tuple[int, int, int, str, int]]) -> None:
+    '''checkpoints: (step, x, y, orientation, offset)'''
+    with open(checkpoint_file, 'w', newline='') as cp_f:
+        cp_writer = csv.writer(cp_f)
+        cp_writer.writerow(CHECKPOINT_HEADERS)
+        cp_writer.writerows(checkpoints)
+
+
+def apply_actions(myRunner: Runner, actions: str) -> Runner:
+    '''apply actions of one step, e.g. "LF", to the runner'''
+    for action in actions:
+        if action == "L":
+            myRunner.turn("Left")
+        elif action == "R":
+            myRunner.turn("Right")
+        else:
+            myRunner.forward()
+    return myRunner
+
+
+class Replay:
+    def __init__(self, exploration_file: str = "exploration.csv", checkpoint_file: Optional[str] = None):
+        if checkpoint_file == None:
+            checkpoint_file = checkpoint_file_name(exploration_file)
+        self._exploration_file = exploration_file
+
+        # there are only steps / N checkpoints, but store them compactly anyway
+        self._cp_steps = array('Q')
+        self._cp_x = array('i')
+        self._cp_y = array('i')
+        self._cp_orientations: str = ""
+        self._cp_offsets = array('Q')
+
+        orientations: list[str] = []
+        with open(checkpoint_file, 'r', newline='') as cp_f:
+            for row in csv.DictReader(cp_f):
+                self._cp_steps.append(int(row["Step"]))
+                self._cp_x.append(int(row["x-coordinate"]))
+                self._cp_y.append(int(row["y-coordinate"]))
+                orientations.append(row["Orientation"])
+                self._cp_offsets.append(int(row["Offset"]))
+        self._cp_orientations = "".join(orientations)
+
+        if len(self._cp_steps) == 0 or self._cp_steps[0] != 0:
+            raise ValueError("Checkpoint file must start with the checkpoint of step 0")
+
+        # total number of steps: steps after the last checkpoint are less than N
+        self._steps: int = 0
+        for (step, actions, myRunner) in self._walk(len(self._cp_steps) - 1):
+            self._steps = step
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    def _checkpoint_before(self, step: int) -> int:
+        self._check_step(step)
+        return bisect_right(self._cp_steps, step) - 1
+
+    def _check_step(self, step: int) -> None:
+        if step < 0 or step > self._steps:
+            raise ValueError(f"Step must be between 0 and {self._steps}")
+
+    def _walk(self, checkpoint: int) -> Iterator[tuple[int, str, Runner]]:
+        ''' Starting from the checkpoint, yields (step, actions of the step, runner after the step) till the end of
+            the exploration file. The checkpoint itself comes first with no actions.
+            The same runner is updated at each step, copy it if you want to keep it.
+        '''
+        step: int = self._cp_steps[checkpoint]
+        myRunner = Runner(self._cp_x[checkpoint], self._cp_y[checkpoint], self._cp_orientations[checkpoint])
+        yield (step, "", myRunner)
+
+        with open(self._exploration_file, 'r', newline='') as exp_f:
+            exp_f.seek(self._cp_offsets[checkpoint])
+            for row in csv.reader(exp_f):
+                step += 1
+                apply_actions(myRunner, row[3])
+                yield (step, row[3], myRunner)
+
+    def seek(self, step: int) -> Runner:
+        '''Return the runner after the given number of steps'''
+        for (current, actions, myRunner) in self._walk(self._checkpoint_before(step)):
+            if current == step:
+                return myRunner
+
+    def frames(self, start: int = 0, stop: Optional[int] = None, reverse: bool = False) -> Iterator[tuple[int, Runner]]:
+        ''' Yields (step, runner) for the steps in range(start, stop), stop is the last step + 1 by default.
+            Backwards replay goes through the checkpoints from the end and keeps only the frames between two
+            checkpoints in memory.
+        '''
+        if stop == None:
+            stop = self._steps + 1
+        if start >= stop:
+            return
+        self._check_step(start)
+        self._check_step(stop - 1)
+
+        if not reverse:
+            yield from self._forward_frames(start, stop)
+            return
+
+        checkpoint: int = self._checkpoint_before(stop - 1)
+        while stop > start:
+            block_start: int = max(start, self._cp_steps[checkpoint])
+            yield from reversed(list(self._forward_frames(block_start, stop)))
+            stop = block_start
+            checkpoint -= 1
+
+    def _forward_frames(self, start: int, stop: int) -> Iterator[tuple[int, Runner]]:
+        for (step, actions, myRunner) in self._walk(self._checkpoint_before(start)):
+            if step >= stop:
+                break
+            if step >= start:
+                yield (step, Runner(myRunner.x, myRunner.y, myRunner.orientation))
+
+    def statistics(self, start: int = 0, stop: Optional[int] = None) -> dict[str, int]:
+        ''' Statistics of the steps taken to go from step start to step stop(the last step by default):
+            number of steps, forward moves, left and right turns, U-turns("LLF") and distinct cells visited.
+        '''
+        if stop == None:
+            stop = self._steps
+        self._check_step(stop)
+        if start > stop:
+            raise ValueError(f"Start({start}) must not be after stop({stop})")
+
+        stats: dict[str, int] = {"steps": 0, "forward": 0, "left": 0, "right": 0, "u_turns": 0, "cells": 0}
+        cells: set[tuple[int, int]] = set()
+        for (step, actions, myRunner) in self._walk(self._checkpoint_before(start)):
+            if step > stop:
+                break
+            if step < start:
+                continue
+            cells.add(myRunner.get_position())
+            if step > start:
+                stats["steps"] += 1
+                stats["forward"] += actions.count("F")
+                stats["left"] += actions.count("L")
+                stats["right"] += actions.count("R")
+                if actions == "LLF":
+                    stats["u_turns"] += 1
+
+        stats["cells"] = len(cells)
+        return stats
+
+    def print_frames(self, maze: "Maze", start: int = 0, stop: Optional[int] = None, reverse: bool = False) -> None:
+        for (step, myRunner) in self.frames(start, stop, reverse):
+            print(f"Step {step}")
+            maze.print_visualization(myRunner)
+
+    def plot_frames(self, maze: "Maze", ax, start: int = 0, stop: Optional[int] = None, reverse: bool = False,
+                    pause: float = 0.2) -> None:
+        '''same animation as in maze_runner.py, but only for the given range of steps'''
+        for (step, myRunner) in self.frames(start, stop, reverse):
+            myRunner.plot(ax, "green")
+            plt.pause(pause)
+            myRunner.plot(ax, "red")
@@ -0,0 +1,42 @@
+import pytest
+
+from maze import Maze  # type: ignore
+
+
+def test_plan_route() -> None:
+    """A Unit test for :func:maze.Maze.plan_route function"""
+    maze = Maze(2, 2)
+    maze.add_vertical_wall(0, 1)    # wall between (0, 0) and (1, 0)
+    path, actions = maze.plan_route((0, 0), (1, 0))
+    assert path == [(0, 0), (0, 1), (1, 1), (1, 0)]
+    assert actions == "FRFRF"
+
+
+def test_plan_route_turn_costs() -> None:
+    """A Unit test for :func:maze.Maze.plan_route function with expensive right turns"""
+    maze = Maze(2, 2)
+    # turning left three times is cheaper than turning right once
+    path, actions = maze.plan_route((0, 0), (1, 0), right_cost=10)
+    assert path == [(0, 0), (1, 0)]
+    assert actions == "LLLF"
+
+
+def test_shortest_path(tmp_path) -> None:
+    """A Unit test for :func:maze.Maze.shortest_path function when the runner walks into a dead end"""
+    maze = Maze(3, 2)
+    maze.add_horizontal_wall(1, 1)  # wall between (1, 0) and (1, 1)
+    maze.add_vertical_wall(1, 2)    # wall between (1, 1) and (2, 1), so (0, 1) and (1, 1) is a dead end
+    explored = [(0, 0), (0, 1), (1, 1), (0, 1), (0, 0), (1, 0), (2, 0), (2, 1)]
+
+    for _ in range(2):  # explored coordinates of the previous call are forgotten
+        path = maze.shortest_path(None, None, str(tmp_path / "exploration.csv"), str(tmp_path / "statistics.txt"))
+        assert path == [(0, 0), (1, 0), (2, 0), (2, 1)]
+        assert maze.explored_coordinates == explored
+
+
+def test_plan_route_out_of_dimension() -> None:
+    """A Unit test for :func:maze.Maze.plan_route function with coordinates outside of the maze"""
+    maze = Maze(3, 3)
+    for (starting, goal) in [((0, 0), (0, 3)), ((0, 0), (-1, 0)), ((-1, 2), (2, 2)), ((0, 0), (3, 0))]:
+        with pytest.raises(ValueError):
+            maze.plan_route(starting, goal)
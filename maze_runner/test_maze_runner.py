@@ -0,0 +1,30 @@
+import pytest
+
+from maze_runner import maze_reader  # type: ignore
+
+
+def test_maze_reader(tmp_path) -> None:
+    """A Unit test for :func:maze_runner.maze_reader function"""
+    maze_file = tmp_path / "maze.mz"
+    maze_file.write_text("#####\n#.#.#\n#.#.#\n#...#\n#####\n")
+    maze = maze_reader(str(maze_file), str(tmp_path / "statistics.txt"))
+    assert (maze.width, maze.height) == (2, 2)
+    assert maze.get_walls(0, 0) == (False, False, True, True)
+    assert maze.get_walls(0, 1) == (True, True, False, True)
+    assert maze.get_walls(1, 1) == (True, True, False, True)
+
+
+def test_maze_reader_incorrect_character(tmp_path) -> None:
+    """A Unit test for :func:maze_runner.maze_reader function with an illegal symbol"""
+    maze_file = tmp_path / "maze.mz"
+    maze_file.write_text("#####\n#x#.#\n#.#.#\n#...#\n#####\n")
+    with pytest.raises(ValueError, match="Incorrect character"):
+        maze_reader(str(maze_file), str(tmp_path / "statistics.txt"))
+
+
+def test_maze_reader_error_priority(tmp_path) -> None:
+    """A Unit test for :func:maze_runner.maze_reader function, external walls are checked before symbols"""
+    maze_file = tmp_path / "maze.mz"
+    maze_file.write_text("#####\n#x#.#\n#.#.#\n#...#\n###.#\n")
+    with pytest.raises(ValueError, match="Incorrect character in external wall"):
+        maze_reader(str(maze_file), str(tmp_path / "statistics.txt"))
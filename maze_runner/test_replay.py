@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from maze import Maze  # type: ignore
+from replay import Replay, checkpoint_file_name  # type: ignore
+from runner import Runner  # type: ignore
+
+
+def create_maze() -> Maze:
+    """3 x 2 maze where the runner walks into the dead end (0, 1) - (1, 1) and has to make a U-turn"""
+    maze = Maze(3, 2)
+    maze.add_horizontal_wall(1, 1)  # wall between (1, 0) and (1, 1)
+    maze.add_vertical_wall(1, 2)    # wall between (1, 1) and (2, 1)
+    return maze
+
+
+def explore(tmp_path, checkpoint_interval: int) -> tuple[list[tuple[int, int, str]], list[str]]:
+    """explores the maze and returns the states of the runner at each step and the actions of each step"""
+    create_maze().explore(Runner(), None, str(tmp_path / "exploration.csv"), checkpoint_interval)
+
+    states = [(0, 0, "N")]
+    actions = []
+    myRunner = Runner()
+    other_maze = create_maze()
+    while myRunner.get_position() != (2, 1):
+        (myRunner, move_seq) = other_maze.move(myRunner)
+        states.append((myRunner.x, myRunner.y, myRunner.orientation))
+        actions.append(move_seq)
+    return (states, actions)
+
+
+def expected_statistics(states: list[tuple[int, int, str]], actions: list[str], start: int, stop: int) -> dict[str, int]:
+    window = actions[start:stop]    # actions[k] is the step from state k to state k + 1
+    return {
+        "steps": stop - start,
+        "forward": sum(a.count("F") for a in window),
+        "left": sum(a.count("L") for a in window),
+        "right": sum(a.count("R") for a in window),
+        "u_turns": window.count("LLF"),
+        "cells": len({(x, y) for (x, y, _) in states[start:stop + 1]}),
+    }
+
+
+def test_seek(tmp_path) -> None:
+    """A Unit test for :func:replay.Replay.seek function"""
+    (states, _) = explore(tmp_path, 3)
+    replay = Replay(str(tmp_path / "exploration.csv"))
+    assert replay.steps == len(states) - 1
+    for step in range(len(states)):
+        myRunner = replay.seek(step)
+        assert (myRunner.x, myRunner.y, myRunner.orientation) == states[step]
+
+
+def test_frames_reverse(tmp_path) -> None:
+    """A Unit test for :func:replay.Replay.frames function replaying backwards"""
+    (states, _) = explore(tmp_path, 2)
+    replay = Replay(str(tmp_path / "exploration.csv"))
+    frames = [(step, (r.x, r.y, r.orientation)) for (step, r) in replay.frames(1, len(states), reverse=True)]
+    assert frames == [(step, states[step]) for step in range(len(states) - 1, 0, -1)]
+
+
+def test_statistics(tmp_path) -> None:
+    """A Unit test for :func:replay.Replay.statistics function"""
+    (states, actions) = explore(tmp_path, 2)
+    assert "LLF" in actions
+    replay = Replay(str(tmp_path / "exploration.csv"))
+
+    assert replay.statistics() == expected_statistics(states, actions, 0, len(actions))
+    for (start, stop) in [(1, 4), (3, 3), (2, len(actions))]:
+        assert replay.statistics(start, stop) == expected_statistics(states, actions, start, stop)
+
+    with pytest.raises(ValueError):
+        replay.statistics(3, 1)
+
+
+def test_stale_checkpoints(tmp_path) -> None:
+    """A Unit test for :func:maze.Maze.explore function, checkpoints of the previous exploration are removed"""
+    exploration_file = str(tmp_path / "exploration.csv")
+    explore(tmp_path, 2)
+    assert os.path.exists(checkpoint_file_name(exploration_file))
+    create_maze().explore(Runner(), None, exploration_file)
+    assert not os.path.exists(checkpoint_file_name(exploration_file))
@@ -0,0 +1,24 @@
+from trajectory import Trajectory  # type: ignore
+
+
+def test_record() -> None:
+    """A Unit test for :func:trajectory.Trajectory.record function"""
+    trajectory = Trajectory(3, 4)
+    trajectory.start(0, 0)
+    trajectory.record("F", 0, 1)
+    trajectory.record("RF", 1, 1)
+    trajectory.record("LLF", 0, 1)
+    assert len(trajectory) == 3
+    assert trajectory.coordinates() == [(0, 0), (0, 1), (1, 1), (0, 1)]
+    assert trajectory.actions() == "FRFLLF"
+
+
+def test_run_length_encoded() -> None:
+    """A Unit test for :func:trajectory.Trajectory.run_length_encoded function"""
+    trajectory = Trajectory(1, 5)
+    trajectory.start(0, 0)
+    for y in range(1, 4):
+        trajectory.record("F", 0, y)
+    trajectory.record("LLF", 0, 2)
+    trajectory.record("F", 0, 1)
+    assert trajectory.run_length_encoded() == [("F", 3), ("LLF", 1), ("F", 1)]
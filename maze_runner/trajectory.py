@@ -0,0 +1,105 @@
+"""
+    This module implements the Trajectory class which keeps the path of the runner in a compact form.
+
+    Storing every explored coordinate as a tuple and every action as a piece of a string costs around
+    100 bytes per step. For long explorations that is too much, so the trajectory is stored as:
+
+    - cells: index of every visited cell in an array('I') (4 bytes per step).
+      Index of the cell (x, y) is x * height + y, which follows the layout of the stored maze(self._maze).
+    - opcodes: one byte per step in a bytearray. Every step of Maze.move is one of "F", "LF", "RF" or "LLF",
+      so each step is encoded by its index in ACTIONS.
+
+    List of coordinates, action string and run-length-encoded form are built only when they are requested.
+
+    Author: Rasul Abbaszada
+"""
+
+from array import array
+import io
+from typing import Iterator
+
+# opcode of a step is its index in this tuple
+ACTIONS: tuple[str, ...] = ("F", "LF", "RF", "LLF")
+_OPCODES: dict[str, int] = {action: opcode for opcode, action in enumerate(ACTIONS)}
+
+
+class Trajectory:
+    def __init__(self, width: int = 5, height: int = 5):
+        self._width = width
+        self._height = height
+        self._cells = array('I')
+        self._opcodes = bytearray()
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def height(self):
+        return self._height
+
+    @property
+    def cells(self) -> array:
+        return self._cells
+
+    @property
+    def opcodes(self) -> bytearray:
+        return self._opcodes
+
+    def __len__(self) -> int:
+        '''number of steps. (number of cells is one more, because of the starting cell)'''
+        return len(self._opcodes)
+
+    def cell_index(self, x: int, y: int) -> int:
+        return x * self._height + y
+
+    def cell_coordinates(self, index: int) -> tuple[int, int]:
+        return divmod(index, self._height)
+
+    def start(self, x: int, y: int) -> None:
+        '''forget the previous trajectory and record the starting cell'''
+        self._cells = array('I', [self.cell_index(x, y)])
+        self._opcodes = bytearray()
+
+    def record(self, move_seq: str, x: int, y: int) -> None:
+        '''record one step: actions taken by the runner and the cell it has reached'''
+        if move_seq not in _OPCODES:
+            raise ValueError(f"Unknown move sequence: {move_seq}")
+        self._opcodes.append(_OPCODES[move_seq])
+        self._cells.append(self.cell_index(x, y))
+
+    def iter_coordinates(self) -> Iterator[tuple[int, int]]:
+        for index in self._cells:
+            yield divmod(index, self._height)
+
+    def coordinates(self) -> list[tuple[int, int]]:
+        return list(self.iter_coordinates())
+
+    def actions(self) -> str:
+        '''action string in the same format Maze.explore returns, e.g. "LFFRFLLF"'''
+        # written piece by piece, so there is no temporary list with one string per step
+        sequence = io.StringIO()
+        for opcode in self._opcodes:
+            sequence.write(ACTIONS[opcode])
+        return sequence.getvalue()
+
+    def run_length_encoded(self) -> list[tuple[str, int]]:
+        '''
+            Consecutive equal steps are grouped together, e.g. "FFFLFLF" -> [("F", 3), ("LF", 2)].
+            Long corridors become a single pair.
+        '''
+        runs: list[tuple[str, int]] = []
+        if len(self._opcodes) == 0:
+            return runs
+
+        current: int = self._opcodes[0]
+        count: int = 0
+        for opcode in self._opcodes:
+            if opcode == current:
+                count += 1
+            else:
+                runs.append((ACTIONS[current], count))
+                current = opcode
+                count = 1
+        runs.append((ACTIONS[current], count))
+        return runs